@@ -17,8 +17,6 @@
 
 package ORG.oclc.oai.harvester2.verb;
 
-import java.io.ByteArrayInputStream;
-import java.io.ByteArrayOutputStream;
 import java.io.FileInputStream;
 import org.apache.logging.log4j.LogManager;
 import org.apache.logging.log4j.Logger;
@@ -46,12 +44,12 @@ import java.net.MalformedURLException;
 import java.net.URL;
 import java.nio.file.Path;
 import java.util.Date;
-import java.util.HashMap;
 import java.util.List;
 import java.util.zip.GZIPInputStream;
 import java.util.zip.InflaterInputStream;
 import java.util.zip.ZipInputStream;
 import javax.xml.stream.XMLStreamException;
+import nl.mpi.oai.harvester.utils.ByteArrayBuffer;
 import nl.mpi.oai.harvester.utils.DocumentSource;
 import nl.mpi.oai.harvester.utils.MarkableFileInputStream;
 import org.codehaus.stax2.XMLInputFactory2;
@@ -78,7 +76,7 @@ public abstract class HarvesterVerb {
     private Document doc = null;
     private String schemaLocation = null;
     private String requestURL = null;
-    private static HashMap builderMap = new HashMap();
+    private static final ThreadLocal<DocumentBuilder> builders = new ThreadLocal<>();
     private static Element namespaceElement = null;
     private static DocumentBuilderFactory factory = null;
     private static TransformerFactory xformFactory = TransformerFactory.newInstance();
@@ -89,9 +87,8 @@ public abstract class HarvesterVerb {
 	        factory = DocumentBuilderFactory
 	        .newInstance();
 	        factory.setNamespaceAware(true);
-	        Thread t = Thread.currentThread();
 	        DocumentBuilder builder = factory.newDocumentBuilder();
-	        builderMap.put(t, builder);
+	        builders.set(builder);
 	        
 	        DOMImplementation impl = builder.getDOMImplementation();
 	        Document namespaceHolder = impl.createDocument(
@@ -170,15 +167,16 @@ public abstract class HarvesterVerb {
      */
     public Document getDocument() throws ParserConfigurationException, SAXException, IOException {
         if (doc == null) {
-            Thread t = Thread.currentThread();
-            DocumentBuilder builder = (DocumentBuilder) builderMap.get(t);
+            DocumentBuilder builder = builders.get();
             if (builder == null) {
                 builder = factory.newDocumentBuilder();
-                builderMap.put(t, builder);
-            }
+                builders.set(builder);
+            } else
+                builder.reset();
             doc = builder.parse(getSource());
             str = null;
-            logger.debug("switched from stream to tree for request["+requestURL+"]",new Throwable());
+            if (logger.isDebugEnabled())
+                logger.debug("switched from stream to tree for request["+requestURL+"]",new Throwable());
         }
         return doc;
     }
@@ -317,8 +315,10 @@ public abstract class HarvesterVerb {
                 this.requestURL = con.getHeaderField("Location");
                 logger.debug("redirect to requestURL=" + this.requestURL);
                 url = new URL(this.requestURL);
+                discard(con);
                 responseCode = HttpURLConnection.HTTP_UNAVAILABLE;
             } else if (responseCode == HttpURLConnection.HTTP_UNAVAILABLE) {
+                discard(con);
                 long retrySeconds = con.getHeaderFieldInt("Retry-After", -1);
                 if (retrySeconds == -1) {
                     long now = (new Date()).getTime();
@@ -352,17 +352,46 @@ public abstract class HarvesterVerb {
             in = con.getInputStream();
         }
         
-        if (temp!=null) {
-            FileOutputStream out = new FileOutputStream(temp.toFile());
-            org.apache.commons.io.IOUtils.copy(in,out,1000000);
-            out.close();
-            logger.debug("temp["+temp+"] for URL["+requestURL+"]");
-            str = new MarkableFileInputStream(new FileInputStream(temp.toFile()));
-        } else {
-            ByteArrayOutputStream baos = new ByteArrayOutputStream();
-            int size = org.apache.commons.io.IOUtils.copy(in, baos);
-            logger.debug("buffered ["+size+"] bytes for URL["+requestURL+"]");
-            str = new ByteArrayInputStream(baos.toByteArray());
+        // the response is read completely and the stream closed, so the
+        // connection can go back to the keep-alive cache and be reused
+        // for the next request to the same endpoint
+        try {
+            if (temp!=null) {
+                try (FileOutputStream out = new FileOutputStream(temp.toFile())) {
+                    org.apache.commons.io.IOUtils.copy(in,out,1000000);
+                }
+                logger.debug("temp["+temp+"] for URL["+requestURL+"]");
+                str = new MarkableFileInputStream(new FileInputStream(temp.toFile()));
+            } else {
+                ByteArrayBuffer baos = new ByteArrayBuffer();
+                int size = org.apache.commons.io.IOUtils.copy(in, baos);
+                logger.debug("buffered ["+size+"] bytes for URL["+requestURL+"]");
+                // hand out the buffer itself instead of a copy of it
+                str = baos.toInputStream();
+            }
+        } finally {
+            in.close();
+        }
+    }
+
+    /**
+     * Read and close whatever body came with a response we are not going
+     * to use (redirect, 503), so the underlying socket is kept alive
+     * instead of being thrown away.
+     *
+     * @param con the connection
+     */
+    private static void discard(HttpURLConnection con) {
+        InputStream body = con.getErrorStream();
+        try {
+            if (body == null)
+                body = con.getInputStream();
+            try (InputStream in = body) {
+                org.apache.commons.io.IOUtils.skip(in, Long.MAX_VALUE);
+            }
+        } catch (IOException e) {
+            // nothing to reuse then
+            logger.debug("couldn't discard response body: " + e.getMessage());
         }
     }
     
@@ -7,6 +7,7 @@ module oai.harvest.manager {
     requires stax2.api;
     requires java.xml;
     requires java.management;
+    requires java.net.http;
     requires org.joda.time;
     requires java.xml.bind;
     requires org.apache.commons.io;
@@ -83,6 +83,9 @@ public class Provider {
     
     /** Do I need some time on my own? */
     public boolean exclusive = false;
+
+    /** Identify response, both the name and the deletion mode come from it */
+    private Document identify = null;
     
     /** Type of prefix harvesting that applies to the provider */
     public Harvesting prefixHarvesting;
@@ -160,6 +163,8 @@ public class Provider {
     public void init() {
 		if (name == null) fetchName();
 		if(deletionMode == null) fetchDeletionMode();
+		// no need to keep the response around
+		identify = null;
     }
 
     public void close() {
@@ -238,8 +243,7 @@ public class Provider {
      */
     public String getProviderName() {
         try {
-            Identify ident = new Identify(oaiUrl, timeout);
-            return parseProviderName(ident.getDocument());
+            return parseProviderName(getIdentify());
         } catch (IOException | ParserConfigurationException | SAXException
                     | TransformerException e) {
             logger.error(e.getMessage(), e);
@@ -249,8 +253,7 @@ public class Provider {
 
     public DeletionMode getProviderDeletionMode() {
         try {
-            Identify ident = new Identify(oaiUrl, timeout);
-            return parseDeletionMode(ident.getDocument());
+            return parseDeletionMode(getIdentify());
         } catch (IOException | ParserConfigurationException | SAXException
                 | TransformerException e) {
             logger.error(e.getMessage(), e);
@@ -258,6 +261,20 @@ public class Provider {
         return null;
     }
 
+    /**
+     * Make an Identify request, or reuse the response of the previous one.
+     *
+     * @return DOM tree representing the Identify response
+     */
+    private Document getIdentify() throws IOException,
+            ParserConfigurationException, SAXException, TransformerException {
+        if (identify == null) {
+            Identify ident = new Identify(oaiUrl, timeout);
+            identify = ident.getDocument();
+        }
+        return identify;
+    }
+
     /**
      * Parse provider's name from an Identify response.
      *
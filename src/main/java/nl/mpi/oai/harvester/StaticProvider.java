@@ -143,6 +143,13 @@ public class StaticProvider extends Provider {
 	return parseProviderName(doc);
     }
 
+    @Override
+    public DeletionMode getProviderDeletionMode() {
+	// the static content has been fetched already, don't request it again
+	Document doc = getSubtree("/os:Repository/os:Identify");
+	return parseDeletionMode(doc);
+    }
+
     @Override
     public List<String> getPrefixes(MetadataFormat format) {
 	try {
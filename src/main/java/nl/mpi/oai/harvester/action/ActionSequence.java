@@ -125,27 +125,24 @@ public class ActionSequence {
      * @param metadata a list of metadata records
      */
     public void runActions(List<Metadata> metadata) {
-
-	// keep track of whether or not the action is the first in the sequence
-	boolean firstAction = true;
-
         for (ResourcePool<Action> actPool : actions) {
                 // claim an action in the pool
                 Action action = actPool.get();
 
-                boolean done = action.perform(metadata);
-                actPool.release(action);
+                boolean done;
+                try {
+                        done = action.perform(metadata);
+                } finally {
+                        // release exactly once, a second release would hand
+                        // the same action to two threads
+                        actPool.release(action);
+                }
                 if (!done) {
                         logger.error("Action " + action + " failed, terminating" +
                                         " sequence");
                         return;
                 } else
                         logger.debug("Action " + action + " was performed");
-                            
-                actPool.release(action);
-                
-                if (firstAction)
-                    firstAction = false;
         }
     }
 
@@ -101,7 +101,8 @@ public class SaveAction implements Action {
 
                     transformer.transform(source, result);
 
-                    logger.debug("saved XML doc[" + path + "] with [" + XPathFactory.newInstance().newXPath().evaluate("count(//*)", record.getDoc()) + "] nodes");
+                    if (logger.isDebugEnabled())
+                        logger.debug("saved XML doc[" + path + "] with [" + XPathFactory.newInstance().newXPath().evaluate("count(//*)", record.getDoc()) + "] nodes");
                 } else {
                     XMLInputFactory2 xmlInputFactory = (XMLInputFactory2) XMLInputFactory2.newInstance();
                     xmlInputFactory.configureForConvenience();
@@ -108,7 +108,8 @@ public class SplitAction implements Action {
                                 "./*[local-name()='header']/*[local-name()='identifier']",
                                 content.item(i),XPathConstants.STRING);
                             if (!status.equals("deleted")) {
-                                logger.debug("split off XML doc["+i+"]["+id+"] with ["+xpath.evaluate("count(//*)", doc)+"] nodes");
+                                if (logger.isDebugEnabled())
+                                    logger.debug("split off XML doc["+i+"]["+id+"] with ["+xpath.evaluate("count(//*)", doc)+"] nodes");
                                 newRecords.add( new Metadata(
                                         id, record.getPrefix(),
                                         doc, record.getOrigin(), false, false));
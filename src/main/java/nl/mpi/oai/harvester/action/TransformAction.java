@@ -32,6 +32,7 @@ import org.apache.logging.log4j.Logger;
 import org.w3c.dom.Document;
 import org.w3c.dom.Node;
 
+import javax.xml.parsers.DocumentBuilder;
 import javax.xml.parsers.DocumentBuilderFactory;
 import javax.xml.parsers.ParserConfigurationException;
 import javax.xml.transform.Source;
@@ -80,6 +81,12 @@ public class TransformAction implements Action {
     /** The configuration */
     private Node config;
 
+    /** The configuration as stylesheet parameter, wrapped on first use. */
+    private XdmNode configParam;
+
+    /** Builder for the result documents, an action is only used by one thread at a time. */
+    private DocumentBuilder builder;
+
     /** 
      * Create a new transform action using the specified XSLT. 
      * 
@@ -138,7 +145,9 @@ public class TransformAction implements Action {
                     }
                 }
                 Source source = null;
-                Document doc = DocumentBuilderFactory.newInstance().newDocumentBuilder().newDocument();
+                if (builder == null)
+                    builder = DocumentBuilderFactory.newInstance().newDocumentBuilder();
+                Document doc = builder.newDocument();
                 DOMDestination output = new DOMDestination(doc);
                 if (record.hasStream()) {
                     source = new SAXSource(record.getSource());
@@ -160,14 +169,18 @@ public class TransformAction implements Action {
                 transformer.setSource(old.asSource());
                 transformer.setDestination(output);
 
-                transformer.setParameter(new QName("config"), Saxon.wrapNode(this.config.getOwnerDocument()));
+                // the configuration doesn't change, so it only needs to be wrapped once
+                if (configParam == null)
+                    configParam = Saxon.wrapNode(this.config.getOwnerDocument());
+                transformer.setParameter(new QName("config"), configParam);
                 transformer.setParameter(new QName("provider_name"), new XdmAtomicValue(record.getOrigin().getName()));
                 transformer.setParameter(new QName("provider_uri"), new XdmAtomicValue(record.getOrigin().getOaiUrl()));
                 transformer.setParameter(new QName("record_identifier"), new XdmAtomicValue(record.getId()));
 
                 transformer.transform();
                 record.setDoc(doc);
-                logger.debug("transformed to XML doc with ["+XPathFactory.newInstance().newXPath().evaluate("count(//*)", record.getDoc())+"] nodes");
+                if (logger.isDebugEnabled())
+                    logger.debug("transformed to XML doc with ["+XPathFactory.newInstance().newXPath().evaluate("count(//*)", record.getDoc())+"] nodes");
             } catch (XPathExpressionException | SaxonApiException | ParserConfigurationException ex) {
                 logger.error("Transformation error: ",ex);
                 return false;
@@ -194,8 +194,9 @@ public class Configuration {
                         + ". This may be an error. Continuing anyway.");
                 continue;
             }
-            String text = curr.getTextContent();
-            if (text != null && !text.isEmpty()
+            // normalize once here, so the getters can parse the value as is
+            String text = curr.getTextContent().trim();
+            if (!text.isEmpty()
                     && !settings.containsKey(opt)) {
                 settings.put(opt, text);
             }
@@ -378,7 +379,7 @@ public class Configuration {
                     logger.info("Importing providers from registry at {}", rUrl);
                     
                     // list of endpoints to be excluded
-                    ArrayList<String> excludeSpec = new ArrayList<>();
+                    HashSet<String> excludeSpec = new HashSet<>();
 
                     // create the list
                     NodeList excludeList = (NodeList) xpath.evaluate("./exclude", importNode,
@@ -412,8 +413,17 @@ public class Configuration {
                             configMap.put(eUrl, configNode);
                         }
                     }
+                    // optionally keep the registry models between runs
+                    Path registryCache = null;
+                    String cacheDir = Util.getNodeText(xpath, "./@cache", registryNode);
+                    if (cacheDir != null) {
+                        Path workDir = Paths.get(getWorkingDirectory());
+                        registryCache = workDir.resolve(cacheDir);
+                        Util.ensureDirExists(registryCache);
+                    }
+
                     // get the list of endpoints from the centre registry
-                    registryReader = new RegistryReader(new java.net.URL(rUrl));
+                    registryReader = new RegistryReader(new java.net.URL(rUrl), registryCache);
                     final Map<String, Collection<CentreRegistrySetDefinition>> endPointOaiPmhSetMap 
                             = registryReader.getEndPointOaiPmhSetMap();
 
@@ -563,7 +573,7 @@ public class Configuration {
         for (KnownOptions x : KnownOptions.values()) {
             String opt = x.toString();
             if (opt.equals(key)) {
-                settings.put(key, value);
+                settings.put(key, (value == null) ? null : value.trim());
                 return;
             }
         }
@@ -591,7 +601,7 @@ public class Configuration {
 
     protected int[] parseRetryDelays(String s) {
         if (s == null) return new int[]{0};
-        String[] sa = s.split("\\s+");
+        String[] sa = s.trim().split("\\s+");
         int[] da = new int[sa.length];
         for (int i=0;i<sa.length;i++)
             da[i] = Integer.valueOf(sa[i]);
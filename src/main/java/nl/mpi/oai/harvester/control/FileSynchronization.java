@@ -35,6 +35,7 @@ import java.nio.file.Path;
 import java.nio.file.Paths;
 import java.text.SimpleDateFormat;
 import java.util.Date;
+import java.util.Set;
 import java.util.concurrent.ConcurrentHashMap;
 import java.util.stream.Stream;
 
@@ -53,7 +54,15 @@ public final class FileSynchronization {
 
     private static final ConcurrentHashMap<Provider, Statistic> statistic = new ConcurrentHashMap<>();
 
+    // lines are appended to the history and remove files in batches instead
+    // of opening the file for every single record
+    private static final int BATCH_SIZE = 64 * 1024;
+    private static final ConcurrentHashMap<File, StringBuffer> pending = new ConcurrentHashMap<>();
+    // the files a provider has lines pending for, so flushing doesn't need its name
+    private static final ConcurrentHashMap<Provider, Set<File>> pendingFiles = new ConcurrentHashMap<>();
+
     public static void execute(Provider provider) {
+        flush(provider);
 
         switch (provider.getDeletionMode()){
 
@@ -234,6 +243,7 @@ public final class FileSynchronization {
     }
 
     public static void saveStatistics(final Provider provider){
+        flush(provider);
         String dir = Main.config.getWorkingDirectory()+ CMDI;
         File file = new File(dir + Util.toFileFormat(provider.getName())+"_history.xml");
         Statistic stats = statistic.get(provider);
@@ -255,6 +265,44 @@ public final class FileSynchronization {
 
     }
 
+    /**
+     *   Queue a line for the given file, it is written once enough lines
+     *   have been collected or when the provider is flushed
+     */
+    private static void append(final Provider provider, final File file, final String line){
+        pendingFiles.computeIfAbsent(provider, p -> ConcurrentHashMap.newKeySet()).add(file);
+        StringBuffer sb = pending.computeIfAbsent(file, f -> new StringBuffer());
+        synchronized (sb) {
+            sb.append(line);
+            if (sb.length() >= BATCH_SIZE) {
+                writeToHistoryFile(file, sb.toString());
+                sb.setLength(0);
+            }
+        }
+    }
+
+    private static void flush(final File file){
+        StringBuffer sb = pending.remove(file);
+        if (sb != null) {
+            synchronized (sb) {
+                if (sb.length() > 0)
+                    writeToHistoryFile(file, sb.toString());
+                sb.setLength(0);
+            }
+        }
+    }
+
+    /**
+     *   Write out the pending history and remove lines of a provider
+     */
+    public static void flush(final Provider provider){
+        Set<File> files = pendingFiles.remove(provider);
+        if (files != null) {
+            for (File file : files)
+                flush(file);
+        }
+    }
+
     public static Statistic getProviderStatistic(Provider provider){
         return  statistic.get(provider);
     }
@@ -271,17 +319,13 @@ public final class FileSynchronization {
                         .append("name=\"").append(filePath.getFileName()).append("\" ")
                         .append("operation=\"" + operation.name()).append("\" ")
                         .append("/>\n");
-        writeToHistoryFile(file, sb.toString());
+        append(provider, file, sb.toString());
     }
 
     public static  void saveFilesToRemove(String file, Provider provider){
         String dir = Main.config.getWorkingDirectory()+ CMDI + Util.toFileFormat(provider.getName());
         java.io.File toRemove = new java.io.File(dir+"_remove.txt");
-        try(FileWriter writer = new FileWriter(toRemove, true)) {
-            writer.write(file + "\n");
-        } catch (IOException e) {
-            e.printStackTrace();
-        }
+        append(provider, toRemove, file + "\n");
     }
     public enum Operation{
         INSERT, DELETE
@@ -29,8 +29,12 @@ import javax.xml.parsers.ParserConfigurationException;
 import javax.xml.xpath.XPathExpressionException;
 import java.io.File;
 import java.io.IOException;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.concurrent.ExecutionException;
 import java.util.concurrent.ExecutorService;
-import java.util.concurrent.ScheduledThreadPoolExecutor;
+import java.util.concurrent.Executors;
+import java.util.concurrent.Future;
 
 
 /**
@@ -48,7 +52,8 @@ public class Main {
     private static void runHarvesting(Configuration config) {
 	config.log();
         
-        ExecutorService executor = new ScheduledThreadPoolExecutor(config.getMaxJobs());
+        // one fixed pool for all the workers, max-jobs providers at a time
+        ExecutorService executor = Executors.newFixedThreadPool(config.getMaxJobs());
 
 	// create a CycleFactory
 	CycleFactory factory = new CycleFactory();
@@ -56,13 +61,33 @@ public class Main {
 	File OverviewFile = new File (config.getOverviewFile());
 	Cycle cycle = factory.createCycle(OverviewFile);
 
+	List<Future<?>> results = new ArrayList<>();
 	for (Provider provider : config.getProviders()) {
             // create a new worker
 	    Worker worker = new Worker(provider, config, cycle);
-            executor.execute(worker);
+            results.add(executor.submit(worker));
 	}
         
         executor.shutdown();
+
+        // wait for the workers to finish, and count the ones that failed
+        int failed = 0;
+        try {
+            for (Future<?> result : results) {
+                try {
+                    result.get();
+                } catch (ExecutionException e) {
+                    // the worker has logged the details already
+                    failed++;
+                }
+            }
+        } catch (InterruptedException e) {
+            logger.error("Interrupted while waiting for the workers", e);
+            executor.shutdownNow();
+            Thread.currentThread().interrupt();
+        }
+        if (failed > 0)
+            logger.error("Processing failed for " + failed + " of " + results.size() + " providers");
     }
 
     public static void main(String[] args) {
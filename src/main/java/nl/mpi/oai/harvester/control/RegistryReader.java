@@ -28,21 +28,30 @@ import nl.mpi.oai.harvester.Provider;
 import org.apache.logging.log4j.LogManager;
 import org.apache.logging.log4j.Logger;
 
-import java.io.BufferedReader;
 import java.io.IOException;
 import java.io.InputStream;
-import java.io.InputStreamReader;
 import java.io.PrintWriter;
 import java.net.HttpURLConnection;
+import java.net.URI;
+import java.net.URISyntaxException;
 import java.net.URL;
+import java.net.http.HttpClient;
+import java.net.http.HttpRequest;
+import java.net.http.HttpResponse;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.nio.file.StandardCopyOption;
 import java.util.ArrayList;
 import java.util.Collection;
 import java.util.HashMap;
 import java.util.HashSet;
-import java.util.Iterator;
+import java.util.LinkedHashMap;
 import java.util.List;
 import java.util.Map;
-import java.util.Set;
+import java.util.Optional;
+import java.util.concurrent.CompletableFuture;
+import java.util.concurrent.ExecutionException;
 
 /**
  * This class reads information from the REST service of the CLARIN Centre
@@ -55,7 +64,21 @@ public class RegistryReader {
     private static final Logger logger = LogManager.getLogger(RegistryReader.class);
     private static URL registryUrl = null;
 
-    private static final Map<String, DocumentContext> modelCache = new HashMap<>();
+    private final Map<String, DocumentContext> modelCache = new HashMap<>();
+
+    // fields of the model entries, indexed by primary key or by a field value
+    private final Map<String, Map<Object, Map<String, Object>>> indexCache = new HashMap<>();
+
+    // directory to keep the models in between runs, null if not configured
+    private final Path cacheDir;
+    
+    // the models the endpoint set map is built from
+    private static final String[] SET_MAP_MODELS = {"OAIPMHEndpoint", "OAIPMHEndpointSet"};
+
+    // client shared by all registry requests, follows redirects by itself
+    private static final HttpClient client = HttpClient.newBuilder()
+            .followRedirects(HttpClient.Redirect.NORMAL)
+            .build();
     
     //JsonPath configuration
     private static com.jayway.jsonpath.Configuration conf = com.jayway.jsonpath.Configuration.defaultConfiguration();
@@ -64,67 +87,165 @@ public class RegistryReader {
      * Create a new registry reader object.
      */
     public RegistryReader(URL url) {
+        this(url, null);
+    }
+
+    /**
+     * Create a new registry reader object, which keeps the models it read
+     * in a cache directory. On the next run a model is only downloaded
+     * again if the registry reports it has changed.
+     *
+     * @param url the registry URL
+     * @param cacheDir the cache directory, or null for no caching
+     */
+    public RegistryReader(URL url, Path cacheDir) {
         this.registryUrl = url;
+        this.cacheDir = cacheDir;
         
         conf.addOptions(Option.ALWAYS_RETURN_LIST,Option.SUPPRESS_EXCEPTIONS);
     }
 
-    private HttpURLConnection getConnection(URL url, String contentType) throws IOException {
-        HttpURLConnection connection = null;
-        Boolean redirect = false;
-
-        do {
-            connection = (HttpURLConnection) url.openConnection();
-            connection.setInstanceFollowRedirects(false);
-            connection.setRequestMethod("GET");
-            connection.setRequestProperty("Content-Type", contentType);
-            connection.connect();
-
-            int status = connection.getResponseCode();
-            if (status != HttpURLConnection.HTTP_OK) {
-                if (status == HttpURLConnection.HTTP_MOVED_TEMP
-                        || status == HttpURLConnection.HTTP_MOVED_PERM
-                        || status == HttpURLConnection.HTTP_SEE_OTHER) {
-                    redirect = true;
-                    // get redirect url from "location" header field
-                    url = new URL(connection.getHeaderField("Location"));
-                    logger.debug("Center Registry redirect to URL : " + url);
-                } else {
-                    redirect = false;
+    private URI getModelURI(String model) throws IOException {
+        try {
+            return new URI(registryUrl.toString() + (registryUrl.toString().endsWith("/") ? "" : "/") + model);
+        } catch (URISyntaxException e) {
+            throw new IOException("Invalid Center Registry URL: " + e.getMessage(), e);
+        }
+    }
+
+    private synchronized DocumentContext getModel(String model) throws IOException {
+        if (!modelCache.containsKey(model))
+            fetchModels(model);
+        return modelCache.get(model);
+    }
+
+    /**
+     * Fetch models from the registry. All the requests are sent before
+     * the first response is parsed, so the models are downloaded
+     * concurrently.
+     *
+     * @param models the models to fetch, the ones already read are skipped
+     */
+    private synchronized void fetchModels(String... models) throws IOException {
+        Map<String, CompletableFuture<HttpResponse<InputStream>>> responses = new LinkedHashMap<>();
+        try {
+            for (String model : models) {
+                if (modelCache.containsKey(model) || responses.containsKey(model))
+                    continue;
+                HttpRequest.Builder request = HttpRequest.newBuilder(getModelURI(model))
+                        .header("Content-Type", "application/json")
+                        .GET();
+                String etag = getCachedETag(model);
+                if (etag != null)
+                    request.header("If-None-Match", etag);
+                responses.put(model, client.sendAsync(request.build(), HttpResponse.BodyHandlers.ofInputStream()));
+            }
+            for (Map.Entry<String, CompletableFuture<HttpResponse<InputStream>>> response : responses.entrySet()) {
+                try {
+                    modelCache.put(response.getKey(), parseModel(response.getKey(), response.getValue().get()));
+                } catch (ExecutionException e) {
+                    throw new IOException("Failed to read " + response.getKey() + " from the Center Registry", e.getCause());
+                } catch (InterruptedException e) {
+                    Thread.currentThread().interrupt();
+                    throw new IOException("Interrupted while reading from the Center Registry", e);
                 }
             }
+        } finally {
+            // don't leave unread responses behind when one of them failed
+            for (CompletableFuture<HttpResponse<InputStream>> response : responses.values()) {
+                response.thenAccept(r -> {
+                    try {
+                        r.body().close();
+                    } catch (IOException e) {
+                        logger.debug("couldn't close response body: " + e.getMessage());
+                    }
+                });
+            }
+        }
+    }
 
-        } while (redirect);
-        return connection;
+    private Path getCacheFile(String model, String suffix) throws IOException {
+        String name = getModelURI(model).toString().replaceAll("[^a-zA-Z0-9]", "_");
+        return cacheDir.resolve(name + suffix);
     }
 
-    private HttpURLConnection getConnection(String contentType) throws IOException {
-        return getConnection(registryUrl, contentType);
+    /**
+     * Get the ETag of the cached copy of a model.
+     *
+     * @return the ETag, or null if there is no usable cached copy of the model
+     */
+    private String getCachedETag(String model) throws IOException {
+        if (cacheDir == null)
+            return null;
+        Path cacheFile = getCacheFile(model, ".json");
+        Path etagFile = getCacheFile(model, ".etag");
+        if (Files.exists(cacheFile) && Files.exists(etagFile))
+            return new String(Files.readAllBytes(etagFile), StandardCharsets.UTF_8).trim();
+        return null;
     }
 
-    private String getJSONString(InputStream stream) throws IOException {
-        BufferedReader rd = new BufferedReader(new InputStreamReader(stream));
-        StringBuilder sb = new StringBuilder();
-        String line;
-        while ((line = rd.readLine()) != null) {
-            sb.append(line);
+    /**
+     * Parse the model in a registry response. When there is a cache
+     * directory, a 304 Not Modified response means the cached copy is
+     * used, otherwise the new model replaces it.
+     */
+    private DocumentContext parseModel(String model, HttpResponse<InputStream> response) throws IOException {
+        try (InputStream stream = response.body()) {
+            boolean notModified = (response.statusCode() == HttpURLConnection.HTTP_NOT_MODIFIED);
+            if (!notModified && response.statusCode() >= HttpURLConnection.HTTP_BAD_REQUEST)
+                throw new IOException("Center Registry returned " + response.statusCode() + " for " + response.uri());
+            if (cacheDir == null) {
+                // parse straight from the response, no need for an intermediate string
+                return JsonPath.using(conf).parse(stream, "UTF-8");
+            }
+
+            Path cacheFile = getCacheFile(model, ".json");
+            Path etagFile = getCacheFile(model, ".etag");
+            if (notModified && Files.exists(cacheFile)) {
+                logger.debug("Center Registry model " + response.uri() + " not modified, using " + cacheFile);
+            } else {
+                // the old copy is no longer valid, also if storing the new one fails
+                Files.deleteIfExists(etagFile);
+                Files.copy(stream, cacheFile, StandardCopyOption.REPLACE_EXISTING);
+                Optional<String> etag = response.headers().firstValue("ETag");
+                if (etag.isPresent())
+                    Files.write(etagFile, etag.get().getBytes(StandardCharsets.UTF_8));
+                logger.debug("Center Registry model " + response.uri() + " stored in " + cacheFile);
+            }
         }
-        rd.close();
-        return sb.toString();
+        try (InputStream stream = Files.newInputStream(getCacheFile(model, ".json"))) {
+            return JsonPath.using(conf).parse(stream, "UTF-8");
+        }
+    }
+
+    private List<Map<String, Object>> getEntries(String model) throws IOException {
+        return getModel(model).read("$[*]");
     }
 
-    private DocumentContext getModel(String model) throws IOException {
-        DocumentContext res = null;
-        if (modelCache.containsKey(model)) {
-            res = modelCache.get(model);
-        } else {
-            URL regUrl = new URL(registryUrl.toString() + (registryUrl.toString().endsWith("/") ? "" : "/") + model);
-            HttpURLConnection connection = getConnection(regUrl, "application/json");
-            String jsonString = getJSONString(connection.getInputStream());
-            res = JsonPath.using(conf).parse(jsonString);
-            modelCache.put(model,res);
+    /**
+     * Index the fields of the entries of a model, so looking up an entry
+     * doesn't need to filter the whole model.
+     *
+     * @param model the registry model
+     * @param field the field to index on, or null to index on the primary key
+     * @return map from key to the fields of the first entry with that key
+     */
+    private synchronized Map<Object, Map<String, Object>> getIndex(String model, String field) throws IOException {
+        String key = model + (field == null ? "" : "." + field);
+        Map<Object, Map<String, Object>> index = indexCache.get(key);
+        if (index == null) {
+            index = new HashMap<>();
+            for (Map<String, Object> entry : getEntries(model)) {
+                Map<String, Object> fields = (Map<String, Object>) entry.get("fields");
+                if (fields == null)
+                    continue;
+                Object value = (field == null ? entry.get("pk") : fields.get(field));
+                if (value != null)
+                    index.putIfAbsent(value, fields);
+            }
+            indexCache.put(key, index);
         }
-        return res;
+        return index;
     }
 
     /**
@@ -149,25 +270,24 @@ public class RegistryReader {
     String endpointMapping(String endpointUrl,String endpointName) throws IOException {
         String directoryName = Util.toFileFormat(endpointName).replaceAll("/", "");
         
-        Filter provFilter = filter(where("@.fields.uri").is(endpointUrl));
-        List<Integer> iList = (List<Integer>)getModel("OAIPMHEndpoint").read("$.[?].fields.centre", provFilter);
-        Integer centreKey = iList.size()>0? iList.get(0):null;
+        Map<String, Object> endpoint = getIndex("OAIPMHEndpoint", "uri").get(endpointUrl);
+        Object centreKey = (endpoint != null ? endpoint.get("centre") : null);
 
         String centreName = "";
         String nationalProject = "";
 
         if (centreKey != null) {
-            Filter centreFilter = filter(where("pk").is(centreKey));
-            List<String> sList = (List<String>)getModel("Centre").read("$[?].fields.name", centreFilter);
-            centreName = sList.size()>0? sList.get(0):"";
-
-            iList = (List<Integer>)getModel("Centre").read("$[?].fields.consortium", centreFilter);
-            Integer consortiumKey = iList.size()>0? iList.get(0):null;
+            Map<String, Object> centre = getIndex("Centre", null).get(centreKey);
+            Object consortiumKey = null;
+            if (centre != null) {
+                centreName = (centre.get("name") != null ? centre.get("name").toString() : "");
+                consortiumKey = centre.get("consortium");
+            }
         
             if (consortiumKey != null) {
-                Filter consortiumFilter = filter(where("pk").is(consortiumKey));
-                sList = (List<String>)getModel("Consortium").read("$[?].fields.name", consortiumFilter);
-                nationalProject = sList.size()>0? sList.get(0):"";
+                Map<String, Object> consortium = getIndex("Consortium", null).get(consortiumKey);
+                if (consortium != null && consortium.get("name") != null)
+                    nationalProject = consortium.get("name").toString();
             }
         }
         
@@ -177,26 +297,32 @@ public class RegistryReader {
     public Map<String, Collection<CentreRegistrySetDefinition>> getEndPointOaiPmhSetMap() {
         final Map<String, Collection<CentreRegistrySetDefinition>> map = new HashMap<>();
         try {
+            // both models are needed, download them in one go
+            fetchModels(SET_MAP_MODELS);
             final List<String> provUrls = getEndpoints();
-
-            List<String> sList = null;
             for (String provUrl : provUrls) {
-                Set<CentreRegistrySetDefinition> setdef = new HashSet<>();
-                //JsonPath-> $[?(@.fields.uri=='http://www.phonetik.uni-muenchen.de/cgi-bin/BASRepository/oaipmh/oai.pl')].fields.oai_pmh_sets
-                Filter provFilter = filter(where("@.fields.uri").is(provUrl));                
-                List<net.minidev.json.JSONArray> s = (List<net.minidev.json.JSONArray>)getModel("OAIPMHEndpoint").read("$.[?].fields.oai_pmh_sets", provFilter);
-                for(net.minidev.json.JSONArray set:s) {
-                    for (Iterator iter = set.iterator();iter.hasNext();) {
-                        Filter setFilter = filter(where("pk").is((Integer)iter.next()));
-                        sList = (List<String>)getModel("OAIPMHEndpointSet").read("$[?].fields.set_spec", setFilter);
-                        String setSpec = (sList.size()>0 ? sList.get(0) : null);
-                        sList = (List<String>)getModel("OAIPMHEndpointSet").read("$[?].fields.set_type", setFilter);
-                        String setType = (sList.size()>0 ? sList.get(0) : null);
-                        if (setSpec!=null && setType!=null)
-                            setdef.add(new CentreRegistrySetDefinition(setSpec, setType));
-                    }
+                map.put(provUrl, new HashSet<>());
+            }
+
+            // walk over the endpoints once, and look up their sets by key
+            final Map<Object, Map<String, Object>> sets = getIndex("OAIPMHEndpointSet", null);
+            for (Map<String, Object> endpoint : getEntries("OAIPMHEndpoint")) {
+                Map<String, Object> fields = (Map<String, Object>) endpoint.get("fields");
+                if (fields == null || !map.containsKey(fields.get("uri")))
+                    continue;
+                Collection<CentreRegistrySetDefinition> setdef = map.get(fields.get("uri"));
+                List<Object> keys = (List<Object>) fields.get("oai_pmh_sets");
+                if (keys == null)
+                    continue;
+                for (Object key : keys) {
+                    Map<String, Object> set = sets.get(key);
+                    if (set == null)
+                        continue;
+                    Object setSpec = set.get("set_spec");
+                    Object setType = set.get("set_type");
+                    if (setSpec!=null && setType!=null)
+                        setdef.add(new CentreRegistrySetDefinition(setSpec.toString(), setType.toString()));
                 }
-                map.put(provUrl, setdef);
             }
         } catch (IOException e) {
             logger.error("Error reading from centre registry", e);
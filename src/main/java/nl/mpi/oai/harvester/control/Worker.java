@@ -229,6 +229,14 @@ class Worker implements Runnable {
             t = e;
             throw e;
         } finally {
+            // write out whatever history is still buffered, without getting
+            // in the way of the cleanup below
+            try {
+                FileSynchronization.flush(provider);
+            } catch (RuntimeException e) {
+                logger.error("Writing the history failed for " + provider + ": " + e.getMessage(), e);
+            }
+
             provider.close();
                 
             ThreadContext.clearAll();
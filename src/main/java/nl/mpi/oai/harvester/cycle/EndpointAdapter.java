@@ -19,7 +19,6 @@
 package nl.mpi.oai.harvester.cycle;
 
 import nl.mpi.oai.harvester.generated.EndpointType;
-import nl.mpi.oai.harvester.generated.OverviewType;
 import org.joda.time.DateTime;
 import org.joda.time.DateTimeZone;
 
@@ -71,8 +70,9 @@ class EndpointAdapter implements Endpoint {
         endpointType.setURI(endpointURI);
         endpointType.setGroup(group);
 
-        // save the newly created endpoint to the overview
-        xmlOverview.save();
+        /* No need to save the overview here: the endpoint is not part of it
+           yet, and it will be saved when the harvest attempt is recorded.
+         */
 
         return endpointType;
     }
@@ -86,27 +86,8 @@ class EndpointAdapter implements Endpoint {
      */
     private EndpointType FindEndpoint(String endpointURI) {
 
-        // assume the endpoint is not there
-        endpointType = null;
-
-        // iterate over the elements in the harvested element
-        Boolean found = false;
-
-        // JAXB representation of the overview
-        OverviewType overviewType = xmlOverview.overviewType;
-
-        for (int i = 0; i < overviewType.getEndpoint().size() && !found; i++) {
-            endpointType = overviewType.getEndpoint().get(i);
-            if (endpointType.getURI().compareTo(endpointURI) == 0) {
-                found = true;
-            }
-        }
-
-        if (found) {
-            return endpointType;
-        } else {
-            return null;
-        }
+        // the overview keeps the endpoints indexed by URI
+        return xmlOverview.findEndpoint(endpointURI);
     }
 
     /**
@@ -138,7 +119,7 @@ class EndpointAdapter implements Endpoint {
             endpointType = CreateDefault(endpointURI, group);
 
             // and add it to the cycle
-            xmlOverview.overviewType.getEndpoint().add(endpointType);
+            xmlOverview.addEndpoint(endpointType);
         }
     }
 
@@ -23,7 +23,7 @@ import org.joda.time.DateTime;
 import org.joda.time.DateTimeZone;
 
 import java.io.File;
-import java.util.ArrayList;
+import java.util.HashSet;
 import java.util.Date;
 
 /**
@@ -55,7 +55,7 @@ public class XMLBasedCycle implements Cycle {
     private final CycleProperties cycleProperties;
 
     // the endpoint URIs returned to the client in the current cycle
-    private ArrayList<String> endpointsCycled = new ArrayList<>();
+    private HashSet<String> endpointsCycled = new HashSet<>();
 
     /**
      * Associate the cycle with the XML file defining the cycle and endpoint
@@ -71,7 +71,7 @@ public class XMLBasedCycle implements Cycle {
         cycleProperties = xmlOverview.getCycleProperties();
 
         // no longer consider endpoints cycled before
-        endpointsCycled = new ArrayList<>();
+        endpointsCycled = new HashSet<>();
     }
 
     @Override
@@ -25,6 +25,8 @@ import org.joda.time.DateTime;
 
 import javax.xml.bind.JAXB;
 import java.io.File;
+import java.util.HashMap;
+import java.util.Map;
 
 /**
  * <br> OverviewType object marshalling <br><br>
@@ -55,6 +57,9 @@ final class XMLOverview {
     // factory that creates objects of the generated classes
     final ObjectFactory factory;
 
+    // the endpoints in the overview, indexed by their URI
+    private final Map<String, EndpointType> endpoints = new HashMap<>();
+
     /**
      * <br> Associate the cycle with an XML file <br><br>
      *
@@ -86,6 +91,36 @@ final class XMLOverview {
         } else {
             overviewType = (OverviewType) object;
         }
+
+        // index the endpoints, the first one with an URI is the one found
+        for (EndpointType endpointType : overviewType.getEndpoint()) {
+            if (endpointType.getURI() != null) {
+                endpoints.putIfAbsent(endpointType.getURI(), endpointType);
+            }
+        }
+    }
+
+    /**
+     * <br> Look for an endpoint in the overview <br><br>
+     *
+     * @param endpointURI the URI identifying the endpoint
+     * @return            null if the overview does not contain the endpoint,
+     *                    the endpoint otherwise
+     */
+    synchronized EndpointType findEndpoint(String endpointURI) {
+
+        return endpoints.get(endpointURI);
+    }
+
+    /**
+     * <br> Add an endpoint to the overview <br><br>
+     *
+     * @param endpointType the endpoint to add
+     */
+    synchronized void addEndpoint(EndpointType endpointType) {
+
+        overviewType.getEndpoint().add(endpointType);
+        endpoints.putIfAbsent(endpointType.getURI(), endpointType);
     }
 
     /**
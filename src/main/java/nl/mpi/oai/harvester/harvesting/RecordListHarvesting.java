@@ -237,8 +237,11 @@ public class RecordListHarvesting extends ListHarvesting
            in the list. Turn the next node into a document.
          */
         logger.debug("process ["+nIndex+"/"+nodeList.getLength()+"] record from the ListRecords response");
-        Node node = nodeList.item(nIndex).cloneNode(true);
+        Node node = nodeList.item(nIndex);
         nIndex++;
+        /* Make a deep copy of the record, so the XPath expressions below only
+           need to look at the record instead of the whole response.
+         */
         Document doc = provider.db.newDocument();
         Node copy = doc.importNode(node, true);
         doc.appendChild(copy);
@@ -283,10 +286,14 @@ public class RecordListHarvesting extends ListHarvesting
             return null;
         }
         
-        // create a document to store the metadata in
-        dataNode = dataNode.cloneNode(true);
+        /* Create a document to store the metadata in. The copy of the record
+           is not used anymore, so move the metadata instead of copying it
+           once more.
+         */
         doc = provider.db.newDocument();
-        copy = doc.importNode(dataNode, true);
+        copy = doc.adoptNode(dataNode);
+        if (copy == null)
+            copy = doc.importNode(dataNode, true);
         doc.appendChild(copy);
 
         String id = idNode.getTextContent();
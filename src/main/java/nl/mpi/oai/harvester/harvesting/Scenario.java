@@ -24,9 +24,16 @@ import nl.mpi.oai.harvester.metadata.Metadata;
 import nl.mpi.oai.harvester.utils.DocumentSource;
 import org.apache.logging.log4j.LogManager;
 import org.apache.logging.log4j.Logger;
+import org.apache.logging.log4j.ThreadContext;
 
 import java.util.ArrayList;
 import java.util.List;
+import java.util.Map;
+import java.util.concurrent.ArrayBlockingQueue;
+import java.util.concurrent.BlockingQueue;
+import java.util.concurrent.TimeUnit;
+import java.util.concurrent.atomic.AtomicBoolean;
+import java.util.concurrent.atomic.AtomicReference;
 import java.util.concurrent.locks.ReadWriteLock;
 import java.util.concurrent.locks.ReentrantReadWriteLock;
 
@@ -48,6 +55,15 @@ public class Scenario {
     //
     private static final ReadWriteLock exclusiveLock = new ReentrantReadWriteLock(true);
 
+    // number of records fetched ahead while the actions are applied
+    private static final int PREFETCH = 4;
+
+    // marks the end of the prefetched records
+    private static final Object END = new Object();
+
+    // milliseconds the prefetcher waits for room in the queue before checking if it should stop
+    private static final long OFFER_WAIT = 100;
+
     public Scenario (Provider provider, ActionSequence actionSequence) {
         this.provider = provider;
         this.actionSequence = actionSequence;
@@ -152,39 +168,149 @@ public class Scenario {
         }
 
         /* Iterate over the list of pairs, for each pair, get the record it
-           identifies.
+           identifies. The records are fetched by a separate thread, so the
+           endpoint is already asked for the next records while the action
+           sequence is applied to the current one.
+         */
+        final BlockingQueue<Object> queue = new ArrayBlockingQueue<>(PREFETCH);
+        final AtomicReference<Throwable> failure = new AtomicReference<>();
+        /* Set when the worker stops taking records. The fetcher can't rely
+           on being interrupted: the retry sleeps while requesting swallow
+           the interrupt.
          */
-        while(!harvesting.fullyParsed()) {
+        final AtomicBoolean stop = new AtomicBoolean(false);
+        final Map<String, String> context = ThreadContext.getImmutableContext();
+
+        Thread fetcher = new Thread(() -> {
+            // log to the same place as the worker
+            ThreadContext.putAll(context);
             try {
+                try {
+                    while (!stop.get() && !harvesting.fullyParsed()) {
+                        Metadata record;
+                        try {
+                            if (provider.isExclusive()) {
+                                exclusiveLock.writeLock().lock();
+                            } else {
+                                exclusiveLock.readLock().lock();
+                            }
 
-                if (provider.isExclusive()) {
-                    exclusiveLock.writeLock().lock();
-                } else {
-                    exclusiveLock.readLock().lock();
+                            record = (Metadata) harvesting.parseResponse();
+                        } finally {
+                            if (provider.isExclusive()) {
+                                exclusiveLock.writeLock().unlock();
+                            } else {
+                                exclusiveLock.readLock().unlock();
+                            }
+                        }
+
+                        if (record == null) {
+                            // something went wrong, skip the record
+                        } else {
+                            boolean queued = false;
+                            try {
+                                queued = offer(queue, record, stop);
+                            } finally {
+                                // the worker has gone, nobody will process the record
+                                if (!queued)
+                                    record.close();
+                            }
+                        }
+                    }
+                } catch (RuntimeException | Error e) {
+                    // hand the problem over to the worker
+                    failure.set(e);
                 }
+                offer(queue, END, stop);
+            } catch (InterruptedException e) {
+                // the actions failed, stop fetching
+            } finally {
+                ThreadContext.clearAll();
+            }
+        }, Thread.currentThread().getName() + " (prefetch)");
+        fetcher.setDaemon(true);
+        fetcher.start();
 
-                Metadata record = (Metadata) harvesting.parseResponse();
+        try {
+            for (;;) {
+                Object next = queue.take();
+                if (next == END) break;
+
+                Metadata record = (Metadata) next;
+                try {
+
+                    if (provider.isExclusive()) {
+                        exclusiveLock.writeLock().lock();
+                    } else {
+                        exclusiveLock.readLock().lock();
+                    }
 
-                if (record == null) {
-                    // something went wrong, skip the record
-                } else {
                     // apply the action sequence to the record
                     actionSequence.runActions(record);
-                }
-                
-                record.close();
-            } finally {
-                if (provider.isExclusive()) {
-                    exclusiveLock.writeLock().unlock();
-                } else {
-                    exclusiveLock.readLock().unlock();
+                } finally {
+                    record.close();
+
+                    if (provider.isExclusive()) {
+                        exclusiveLock.writeLock().unlock();
+                    } else {
+                        exclusiveLock.readLock().unlock();
+                    }
                 }
             }
+        } catch (InterruptedException e) {
+            Thread.currentThread().interrupt();
+            return false;
+        } finally {
+            stop.set(true);
+            fetcher.interrupt();
+            try {
+                // keep emptying the queue, so the fetcher never waits for room
+                do {
+                    discard(queue);
+                    fetcher.join(OFFER_WAIT);
+                } while (fetcher.isAlive());
+            } catch (InterruptedException e) {
+                Thread.currentThread().interrupt();
+            }
+            // cleanup records that were fetched but not processed
+            discard(queue);
+        }
+
+        Throwable t = failure.get();
+        if (t instanceof RuntimeException) {
+            throw (RuntimeException) t;
+        } else if (t instanceof Error) {
+            throw (Error) t;
         }
 
         return true;
     }
 
+    /**
+     * Put an item in the prefetch queue, waiting for room as long as the
+     * worker is still taking items from it.
+     *
+     * @return false if the worker stopped before the item could be queued
+     */
+    private static boolean offer(BlockingQueue<Object> queue, Object item,
+            AtomicBoolean stop) throws InterruptedException {
+        while (!stop.get()) {
+            if (queue.offer(item, OFFER_WAIT, TimeUnit.MILLISECONDS))
+                return true;
+        }
+        return false;
+    }
+
+    /**
+     * Remove the records from the prefetch queue, and close them.
+     */
+    private static void discard(BlockingQueue<Object> queue) {
+        for (Object next = queue.poll(); next != null; next = queue.poll()) {
+            if (next != END)
+                ((Metadata) next).close();
+        }
+    }
+
     /**
      * <br>Get metadata records directly, that is without first obtaining a list
      * of identifiers pointing to them <br><br>
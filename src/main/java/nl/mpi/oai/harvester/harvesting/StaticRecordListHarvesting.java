@@ -30,7 +30,9 @@ import org.w3c.dom.NodeList;
 
 import javax.xml.xpath.XPathConstants;
 import javax.xml.xpath.XPathExpressionException;
+import java.util.HashMap;
 import java.util.List;
+import java.util.Map;
 import javax.xml.parsers.ParserConfigurationException;
 import nl.mpi.oai.harvester.utils.DocumentSource;
 import org.xml.sax.SAXException;
@@ -62,6 +64,9 @@ public final class StaticRecordListHarvesting extends AbstractListHarvesting
     private static final Logger logger = LogManager.getLogger(
             StaticRecordListHarvesting.class);
 
+    /** <br> the record nodes in the static content, by identifier and prefix */
+    private final Map<IdPrefix, Node> records = new HashMap<>();
+
     /**
      * <br> Associate provider data and desired prefixes
      *
@@ -186,7 +191,16 @@ public final class StaticRecordListHarvesting extends AbstractListHarvesting
         for (int j = 0; j < nodeList.getLength(); j++) {
             String identifier = nodeList.item(j).getNodeValue();
             IdPrefix pair = new IdPrefix(identifier, prefixes.get(pIndex));
-            targets.checkAndInsertSorted(pair);
+            if (targets.checkAndInsertSorted(pair)) {
+                /* Remember the record the identifier belongs to, so that
+                   parseResponse does not need to search the static content
+                   again. The text node is a child of identifier, which is a
+                   child of the header of the record.
+                 */
+                Node record = nodeList.item(j).getParentNode().getParentNode().
+                        getParentNode();
+                records.put(pair, record);
+            }
         }
 
         // the prefix identifier pair list is ready
@@ -219,19 +233,22 @@ public final class StaticRecordListHarvesting extends AbstractListHarvesting
         // get the static content from the response
         Document document = null;
 
-        // parse the content
-        Node node;
-
-        try {
-            document = response.getDocument();
-            node = (Node) provider.xpath.evaluate(expression,
-                    document, XPathConstants.NODE);
-        } catch (ParserConfigurationException | SAXException | IOException | XPathExpressionException e) {
-            // something went wrong, let the scenario try another record
-            logger.error(e.getMessage(), e);
-            logger.info("Cannot get " + pair.prefix + " record with id " +
-                    pair.identifier + " from endpoint " + provider.oaiUrl);
-            return null;
+        // look up the record found while processing the response
+        Node node = records.remove(pair);
+
+        if (node == null) {
+            // not found before, parse the content
+            try {
+                document = response.getDocument();
+                node = (Node) provider.xpath.evaluate(expression,
+                        document, XPathConstants.NODE);
+            } catch (ParserConfigurationException | SAXException | IOException | XPathExpressionException e) {
+                // something went wrong, let the scenario try another record
+                logger.error(e.getMessage(), e);
+                logger.info("Cannot get " + pair.prefix + " record with id " +
+                        pair.identifier + " from endpoint " + provider.oaiUrl);
+                return null;
+            }
         }
 
         // found the record, create a document to store it in
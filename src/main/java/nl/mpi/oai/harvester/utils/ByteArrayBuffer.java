@@ -0,0 +1,45 @@
+/*
+ * Copyright (C) 2016, CLARIN ERIC.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, version 3 of the License.
+ *
+ * This program is distributed in the hope that it will be useful, but
+ * WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * General Public License for more details.
+ *
+ * A copy of the GNU General Public License is included in the file
+ * LICENSE-gpl-3.0.txt. If that file is missing, see
+ * <http://www.gnu.org/licenses/>.
+ */
+
+package nl.mpi.oai.harvester.utils;
+
+import java.io.ByteArrayInputStream;
+import java.io.ByteArrayOutputStream;
+
+/**
+ * A byte array output stream whose content can be read back without
+ * copying it, unlike {@link ByteArrayOutputStream#toByteArray()}.
+ *
+ * The buffer is shared with the input stream, so nothing should be
+ * written to it once it has been turned into an input stream. The input
+ * stream also keeps the slack at the end of the buffer, which can be as
+ * large as the content itself: use it for a single large buffer, like a
+ * response, not for many small records kept at the same time.
+ */
+public class ByteArrayBuffer extends ByteArrayOutputStream {
+
+    public ByteArrayBuffer() {
+        super();
+    }
+
+    /**
+     * @return a markable stream reading the bytes written so far
+     */
+    public synchronized ByteArrayInputStream toInputStream() {
+        return new ByteArrayInputStream(buf, 0, count);
+    }
+}
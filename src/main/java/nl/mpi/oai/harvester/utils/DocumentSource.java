@@ -36,6 +36,15 @@ public class DocumentSource {
     
     private static final Logger logger = LogManager.getLogger(DocumentSource.class);
     
+    // one document builder per thread, instead of a new factory per parse
+    private static final ThreadLocal<DocumentBuilder> builder = ThreadLocal.withInitial(() -> {
+        try {
+            return DocumentBuilderFactory.newInstance().newDocumentBuilder();
+        } catch (ParserConfigurationException ex) {
+            throw new IllegalStateException(ex);
+        }
+    });
+    
     private String id = null;
     
     private Document doc = null;
@@ -74,12 +83,14 @@ public class DocumentSource {
     public Document getDocument() {
         if (doc==null) {
             try {
-                DocumentBuilderFactory dbf = DocumentBuilderFactory.newInstance();
-                DocumentBuilder db = dbf.newDocumentBuilder();
+                DocumentBuilder db = builder.get();
+                db.reset();
                 doc = db.parse(getSource());         
                 str = null;
-                logger.debug("switched from stream to tree for DocumentSource["+id+"]",new Throwable());
-            } catch (ParserConfigurationException | SAXException | IOException ex) {
+                // the stack trace is only worth its cost when it gets logged
+                if (logger.isDebugEnabled())
+                    logger.debug("switched from stream to tree for DocumentSource["+id+"]",new Throwable());
+            } catch (SAXException | IOException ex) {
                 logger.error(ex.getMessage(),ex);
                 logger.debug("failed to switch from stream to tree for DocumentSource["+id+"]");
             }
@@ -104,14 +115,14 @@ public class DocumentSource {
     }
     
     public void setDocument(Document doc) {
-        if (str!=null)
+        if (str!=null && logger.isDebugEnabled())
                 logger.debug("switched from stream to tree for DocumentSource["+id+"]",new Throwable());
         this.doc = doc;
         this.str = null;
     }
     
     public void setStream(InputStream str) {
-        if (doc!=null)
+        if (doc!=null && logger.isDebugEnabled())
                 logger.debug("switched from tree to stream for DocumentSource["+id+"]",new Throwable());
         this.str = str;
         this.doc = null;
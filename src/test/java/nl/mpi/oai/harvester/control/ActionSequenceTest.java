@@ -0,0 +1,91 @@
+/*
+ * Copyright (C) 2014, The Max Planck Institute for
+ * Psycholinguistics.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, version 3 of the License.
+ *
+ * This program is distributed in the hope that it will be useful, but
+ * WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * General Public License for more details.
+ *
+ * A copy of the GNU General Public License is included in the file
+ * LICENSE-gpl-3.0.txt. If that file is missing, see
+ * <http://www.gnu.org/licenses/>.
+ */
+
+package nl.mpi.oai.harvester.control;
+
+import nl.mpi.oai.harvester.action.Action;
+import nl.mpi.oai.harvester.action.ActionSequence;
+import nl.mpi.oai.harvester.metadata.Metadata;
+import nl.mpi.oai.harvester.metadata.MetadataFormat;
+import org.junit.Test;
+
+import java.util.ArrayList;
+import java.util.List;
+
+import static org.junit.Assert.*;
+
+/**
+ * Test that an action sequence hands its pooled actions back exactly once.
+ */
+public class ActionSequenceTest {
+
+    private static final int POOL_SIZE = 2;
+
+    /**
+     * Action with a fixed outcome. Every instance is a different action,
+     * so every test gets pools of its own.
+     */
+    private static class FixedAction implements Action {
+        private final boolean outcome;
+
+        FixedAction(boolean outcome) {
+            this.outcome = outcome;
+        }
+
+        @Override
+        public boolean perform(List<Metadata> records) {
+            return outcome;
+        }
+
+        @Override
+        public Action clone() {
+            return new FixedAction(outcome);
+        }
+    }
+
+    private void assertPoolSizes(ActionSequence sequence) {
+        for (ResourcePool<Action> pool : sequence.getActions()) {
+            assertEquals(POOL_SIZE, pool.getNumAvailable());
+        }
+    }
+
+    @Test
+    public void testPoolSizeUnchanged() {
+        ActionSequence sequence = new ActionSequence(
+                new MetadataFormat("prefix", "cmdi"),
+                new Action[]{new FixedAction(true), new FixedAction(true)},
+                POOL_SIZE);
+        assertPoolSizes(sequence);
+
+        for (int i = 0; i < 3; i++) {
+            sequence.runActions(new ArrayList<Metadata>());
+            assertPoolSizes(sequence);
+        }
+    }
+
+    @Test
+    public void testPoolSizeUnchangedOnFailure() {
+        ActionSequence sequence = new ActionSequence(
+                new MetadataFormat("prefix", "cmdi"),
+                new Action[]{new FixedAction(false), new FixedAction(true)},
+                POOL_SIZE);
+
+        sequence.runActions(new ArrayList<Metadata>());
+        assertPoolSizes(sequence);
+    }
+}
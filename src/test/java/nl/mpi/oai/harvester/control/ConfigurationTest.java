@@ -81,6 +81,15 @@ public class ConfigurationTest {
         assertEquals(false, config.isIncremental());
     }
 
+    @Test
+    public void testSettingsAreTrimmed() throws Exception {
+        final Configuration config = new Configuration();
+        config.setOption("max-jobs", " 4 ");
+        config.setOption("retry-delay", " 1 2 ");
+        assertEquals(4, config.getMaxJobs());
+        assertArrayEquals(new int[]{1, 2}, config.getRetryDelays());
+    }
+
     @Test
     public void testActionSequences() throws Exception {
         final List<ActionSequence> actionSequences = getBasicConfig().getActionSequences();
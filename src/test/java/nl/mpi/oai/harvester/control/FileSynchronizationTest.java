@@ -0,0 +1,101 @@
+/*
+ * Copyright (C) 2016, CLARIN ERIC.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, version 3 of the License.
+ *
+ * This program is distributed in the hope that it will be useful, but
+ * WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * General Public License for more details.
+ *
+ * A copy of the GNU General Public License is included in the file
+ * LICENSE-gpl-3.0.txt. If that file is missing, see
+ * <http://www.gnu.org/licenses/>.
+ */
+
+package nl.mpi.oai.harvester.control;
+
+import nl.mpi.oai.harvester.Provider;
+import org.junit.After;
+import org.junit.Before;
+import org.junit.Rule;
+import org.junit.Test;
+import org.junit.rules.TemporaryFolder;
+
+import java.io.File;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Paths;
+
+import static org.junit.Assert.*;
+import static org.mockito.Mockito.*;
+
+/**
+ * Test the buffered writing of the history and remove files.
+ */
+public class FileSynchronizationTest {
+
+    @Rule
+    public TemporaryFolder workdir = new TemporaryFolder();
+
+    private Configuration savedConfig;
+
+    @Before
+    public void setUp() throws Exception {
+        savedConfig = Main.config;
+        Main.config = new Configuration();
+        Main.config.setOption("workdir", workdir.getRoot().getAbsolutePath());
+        workdir.newFolder("results", "cmdi");
+    }
+
+    @After
+    public void tearDown() {
+        Main.config = savedConfig;
+    }
+
+    /**
+     * Lines are kept until the provider is flushed, and then written in
+     * the order they were saved.
+     */
+    @Test
+    public void testFlush() throws Exception {
+        Provider provider = mock(Provider.class);
+        when(provider.getName()).thenReturn("provider");
+
+        FileSynchronization.saveToHistoryFile(provider, Paths.get("a.xml"), FileSynchronization.Operation.INSERT);
+        FileSynchronization.saveToHistoryFile(provider, Paths.get("b.xml"), FileSynchronization.Operation.DELETE);
+        FileSynchronization.saveFilesToRemove("c.xml", provider);
+
+        File history = new File(workdir.getRoot(), "results/cmdi/provider_history.xml");
+        File remove = new File(workdir.getRoot(), "results/cmdi/provider_remove.txt");
+        assertFalse(history.exists());
+        assertFalse(remove.exists());
+
+        FileSynchronization.flush(provider);
+
+        String lines = new String(Files.readAllBytes(history.toPath()), StandardCharsets.UTF_8);
+        assertTrue(lines.indexOf("name=\"a.xml\" operation=\"INSERT\"") >= 0);
+        assertTrue(lines.indexOf("name=\"a.xml\"") < lines.indexOf("name=\"b.xml\" operation=\"DELETE\""));
+        assertEquals(2, lines.split("\n").length);
+        assertEquals("c.xml\n", new String(Files.readAllBytes(remove.toPath()), StandardCharsets.UTF_8));
+
+        // nothing is written twice
+        FileSynchronization.flush(provider);
+        assertEquals(lines, new String(Files.readAllBytes(history.toPath()), StandardCharsets.UTF_8));
+    }
+
+    /**
+     * Flushing a provider without pending lines doesn't need its name, so
+     * it never triggers an Identify request.
+     */
+    @Test
+    public void testFlushNothingPending() {
+        Provider provider = mock(Provider.class);
+
+        FileSynchronization.flush(provider);
+
+        verify(provider, never()).getName();
+    }
+}
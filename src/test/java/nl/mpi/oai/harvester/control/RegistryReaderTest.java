@@ -36,6 +36,7 @@ import org.junit.Before;
 import org.junit.BeforeClass;
 import org.junit.ClassRule;
 import org.junit.Rule;
+import org.junit.rules.TemporaryFolder;
 import org.w3c.dom.Document;
 import org.xml.sax.SAXException;
 
@@ -67,6 +68,9 @@ public class RegistryReaderTest {
 
     @Rule
     public WireMockClassRule wireMockInstanceRule = wireMockRule;
+
+    @Rule
+    public TemporaryFolder cache = new TemporaryFolder();
     
     @Before
     public void setUp() throws Exception {
@@ -122,6 +126,17 @@ public class RegistryReaderTest {
         assertEquals(0, map.get(endpointUrl2).size());
     }
 
+    @Test
+    public void testGetOaiSetsCentreFailure() throws Exception {
+        // the centres are only needed for the map file, not for the sets
+        stubFor(get(urlEqualTo(REGISTRY_CENTRE_INFO))
+                .willReturn(aResponse()
+                        .withStatus(500)));
+
+        final Map<String, Collection<CentreRegistrySetDefinition>> map = registry.getEndPointOaiPmhSetMap();
+        assertEquals(50, map.size());
+    }
+
     @Test
     public void testGetOaiPmhSetsNone() throws Exception {
         String endpoint = "http://www.clarin.eu";
@@ -135,6 +150,30 @@ public class RegistryReaderTest {
         assertEquals(entry,"\"http://clarin.dk/oaiprovider/\",\"CLARIN_DK_OAI\",\"The CLARIN, Centre at the \"\"University of Copenhagen\"\"\",\"CLARIN-DK\"");
     }
     
+    @Test
+    public void testCachedModel() throws Exception {
+        // the registry tags the model, and reports it unchanged when asked with that tag
+        stubFor(get(urlEqualTo(REGISTRY_ENDPOINT_INFO))
+                .willReturn(aResponse()
+                        .withHeader("ETag", "\"v1\"")
+                        .withBody(getResourceAsString(REGISTRY_ENDPOINT_RESOURCE))));
+        stubFor(get(urlEqualTo(REGISTRY_ENDPOINT_INFO))
+                .withHeader("If-None-Match", equalTo("\"v1\""))
+                .willReturn(aResponse()
+                        .withStatus(304)));
+
+        RegistryReader first = new RegistryReader(new URL(registryURl), cache.getRoot().toPath());
+        assertEquals(50, first.getEndpoints().size());
+
+        // the next run uses the cached copy
+        RegistryReader second = new RegistryReader(new URL(registryURl), cache.getRoot().toPath());
+        assertEquals(50, second.getEndpoints().size());
+
+        verify(2, getRequestedFor(urlEqualTo(REGISTRY_ENDPOINT_INFO)));
+        verify(1, getRequestedFor(urlEqualTo(REGISTRY_ENDPOINT_INFO))
+                .withHeader("If-None-Match", equalTo("\"v1\"")));
+    }
+    
     private static String getResourceAsString(String resourceName) throws IOException {
         final String registryOverviewString;
         try (InputStream infoResourceStream = RegistryReaderTest.class.getResourceAsStream(resourceName)) {
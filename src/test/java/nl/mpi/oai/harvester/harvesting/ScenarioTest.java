@@ -21,13 +21,17 @@ package nl.mpi.oai.harvester.harvesting;
 
 import nl.mpi.oai.harvester.Provider;
 import nl.mpi.oai.harvester.action.ActionSequence;
+import nl.mpi.oai.harvester.metadata.Metadata;
 import nl.mpi.oai.harvester.metadata.MetadataFactory;
+import nl.mpi.oai.harvester.utils.DocumentSource;
 import org.junit.Test;
 import org.xml.sax.SAXException;
 
 import javax.xml.parsers.ParserConfigurationException;
 import javax.xml.transform.TransformerException;
 import java.io.IOException;
+import java.util.ArrayList;
+import java.util.Collections;
 import java.util.List;
 
 import static org.junit.Assert.fail;
@@ -104,6 +108,59 @@ public class ScenarioTest {
         }
     }
 
+    /**
+     * <br> Test that the list identifiers scenario returns when the actions
+     * fail <br><br>
+     *
+     * The mocked harvesting never runs out of records, and it swallows
+     * interrupts like the retry sleeps of a real request do. The scenario
+     * should still stop fetching, and clean up the records fetched.
+     */
+    @Test(timeout = 10000)
+    public void listIdentifiersFailingActionsTest(){
+
+        // mock an endpoint and a failing action sequence
+        Provider endpoint = mock(Provider.class);
+        when(endpoint.isExclusive()).thenReturn(false);
+        ActionSequence sequence = mock(ActionSequence.class);
+        doThrow(new IllegalStateException("action failed"))
+                .when(sequence).runActions(any(Metadata.class));
+
+        // mock a harvesting object with an endless list of records
+        final List<Metadata> records = Collections.synchronizedList(new ArrayList<>());
+        AbstractHarvesting harvesting = mock(AbstractHarvesting.class);
+        when(harvesting.request()).thenReturn(true);
+        when(harvesting.getResponse()).thenReturn(mock(DocumentSource.class));
+        when(harvesting.processResponse(any(DocumentSource.class))).thenReturn(true);
+        when(harvesting.requestMore()).thenReturn(false);
+        when(harvesting.fullyParsed()).thenReturn(false);
+        when(harvesting.parseResponse()).thenAnswer(invocation -> {
+            try {
+                Thread.sleep(10);
+            } catch (InterruptedException e) {
+                // like a retry sleep, carry on
+            }
+            Metadata record = mock(Metadata.class);
+            records.add(record);
+            return record;
+        });
+
+        Scenario scenario = new Scenario(endpoint, sequence);
+        try {
+            scenario.listIdentifiers(harvesting);
+            fail();
+        } catch (IllegalStateException e) {
+            // the failure of the actions is passed on
+        }
+
+        // every record fetched has been closed
+        synchronized (records) {
+            for (Metadata record : records) {
+                verify(record).close();
+            }
+        }
+    }
+
     /**
      * <br> Follow a list scenario <br><br>
      *